@@ -1,8 +1,9 @@
+import functools
 import json
 import logging
 import os
 import platform
-from typing import List
+from typing import Dict, Iterable, List
 
 from config import ROOT_DIR
 
@@ -59,13 +60,17 @@ def _atomic_read_json(file_path: str, default: dict) -> dict:
         return default
 
     try:
-        with open(file_path, "r") as file:
+        # Read raw bytes and let json.loads detect the encoding itself,
+        # skipping the text-mode decoding layer
+        with open(file_path, "rb") as file:
             with FileLock(file):
-                content = file.read()
-                if not content:
+                # Size the read from fstat: empty files are skipped without
+                # a read, others are pulled in with one exact-size read
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
                     return default
-                return json.loads(content)
-    except (json.JSONDecodeError, IOError) as e:
+                return json.loads(file.read(size))
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
         logging.error(f"Error reading cache file {file_path}: {str(e)}")
         return default
 
@@ -85,9 +90,19 @@ def _atomic_write_json(file_path: str, data: dict) -> None:
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        with open(file_path, "w") as file:
+        # Serialize up front so the file is written with a single call
+        payload = json.dumps(data)
+
+        # Open without truncating, so readers holding the lock never
+        # observe an empty file; truncate only once the lock is ours
+        with open(file_path, "a") as file:
+            # Append mode starts at EOF; msvcrt locks from the current
+            # position, so rewind to lock byte 0 like the readers do
+            file.seek(0)
             with FileLock(file):
-                json.dump(data, file, indent=4)
+                file.truncate(0)
+                file.write(payload)
+                file.flush()
     except IOError as e:
         logging.error(f"Error writing cache file {file_path}: {str(e)}")
         raise
@@ -97,6 +112,9 @@ def _atomic_update_json(file_path: str, update_fn, default: dict) -> None:
     """
     Atomically update JSON file with file locking.
 
+    The file is only rewritten when the serialized result differs from
+    what is already on disk, so no-op updates cost a read but no write.
+
     Args:
         file_path: Path to JSON file
         update_fn: Function that takes current data and returns updated data
@@ -127,16 +145,45 @@ def _atomic_update_json(file_path: str, update_fn, default: dict) -> None:
 
                 # Apply update function
                 updated_data = update_fn(data)
+                payload = json.dumps(updated_data)
+
+                # Skip the rewrite entirely when the update changed nothing
+                if payload == content:
+                    return
 
                 # Write updated data
                 file.seek(0)
                 file.truncate()
-                json.dump(updated_data, file, indent=4)
+                file.write(payload)
     except IOError as e:
         logging.error(f"Error updating cache file {file_path}: {str(e)}")
         raise
 
 
+@functools.lru_cache(maxsize=8)
+def _cache_paths(root: str) -> Dict[str, str]:
+    """
+    Builds the cache file paths for a given root directory.
+
+    Memoized per root, so repeated lookups return the same strings and
+    a changed ROOT_DIR simply resolves to a fresh entry.
+
+    Args:
+        root (str): The root directory of the project
+
+    Returns:
+        paths (dict): Mapping of cache names to their paths
+    """
+    base = os.path.join(root, ".mp")
+    return {
+        "base": base,
+        "afm": os.path.join(base, "afm.json"),
+        "twitter": os.path.join(base, "twitter.json"),
+        "youtube": os.path.join(base, "youtube.json"),
+        "results": os.path.join(base, "scraper_results.csv"),
+    }
+
+
 def get_cache_path() -> str:
     """
     Gets the path to the cache file.
@@ -144,7 +191,7 @@ def get_cache_path() -> str:
     Returns:
         path (str): The path to the cache folder
     """
-    return os.path.join(ROOT_DIR, ".mp")
+    return _cache_paths(ROOT_DIR)["base"]
 
 
 def get_afm_cache_path() -> str:
@@ -154,7 +201,7 @@ def get_afm_cache_path() -> str:
     Returns:
         path (str): The path to the AFM cache folder
     """
-    return os.path.join(get_cache_path(), "afm.json")
+    return _cache_paths(ROOT_DIR)["afm"]
 
 
 def get_twitter_cache_path() -> str:
@@ -164,7 +211,7 @@ def get_twitter_cache_path() -> str:
     Returns:
         path (str): The path to the Twitter cache folder
     """
-    return os.path.join(get_cache_path(), "twitter.json")
+    return _cache_paths(ROOT_DIR)["twitter"]
 
 
 def get_youtube_cache_path() -> str:
@@ -174,7 +221,14 @@ def get_youtube_cache_path() -> str:
     Returns:
         path (str): The path to the YouTube cache folder
     """
-    return os.path.join(get_cache_path(), "youtube.json")
+    return _cache_paths(ROOT_DIR)["youtube"]
+
+
+# Maps account providers to the getter for their cache file
+_PROVIDER_PATHS = {
+    "twitter": get_twitter_cache_path,
+    "youtube": get_youtube_cache_path,
+}
 
 
 def get_accounts(provider: str) -> List[dict]:
@@ -187,15 +241,11 @@ def get_accounts(provider: str) -> List[dict]:
     Returns:
         account (List[dict]): The accounts
     """
-    cache_path = ""
-
-    if provider == "twitter":
-        cache_path = get_twitter_cache_path()
-    elif provider == "youtube":
-        cache_path = get_youtube_cache_path()
-    else:
+    path_fn = _PROVIDER_PATHS.get(provider)
+    if path_fn is None:
         logging.warning(f"Unknown provider: {provider}")
         return []
+    cache_path = path_fn()
 
     default_data = {"accounts": []}
     data = _atomic_read_json(cache_path, default_data)
@@ -214,20 +264,32 @@ def add_account(provider: str, account: dict) -> None:
     Returns:
         None
     """
-    cache_path = None
+    add_accounts(provider, [account])
+
+
+def add_accounts(provider: str, accounts: Iterable[dict]) -> None:
+    """
+    Adds several accounts to the cache in a single locked update.
 
-    if provider == "twitter":
-        cache_path = get_twitter_cache_path()
-    elif provider == "youtube":
-        cache_path = get_youtube_cache_path()
-    else:
+    Args:
+        provider (str): The provider (twitter or youtube)
+        accounts (Iterable[dict]): The accounts to add
+
+    Returns:
+        None
+    """
+    path_fn = _PROVIDER_PATHS.get(provider)
+    if path_fn is None:
         logging.error(f"Unknown provider: {provider}")
         return
+    cache_path = path_fn()
+
+    new_accounts = list(accounts)
 
     def update_fn(data):
-        accounts = data.get("accounts", [])
-        accounts.append(account)
-        return {"accounts": accounts}
+        existing = data.get("accounts", [])
+        existing.extend(new_accounts)
+        return {"accounts": existing}
 
     _atomic_update_json(cache_path, update_fn, {"accounts": []})
 
@@ -243,15 +305,11 @@ def remove_account(provider: str, account_id: str) -> None:
     Returns:
         None
     """
-    cache_path = None
-
-    if provider == "twitter":
-        cache_path = get_twitter_cache_path()
-    elif provider == "youtube":
-        cache_path = get_youtube_cache_path()
-    else:
+    path_fn = _PROVIDER_PATHS.get(provider)
+    if path_fn is None:
         logging.error(f"Unknown provider: {provider}")
         return
+    cache_path = path_fn()
 
     def update_fn(data):
         accounts = data.get("accounts", [])
@@ -283,11 +341,25 @@ def add_product(product: dict) -> None:
     Returns:
         None
     """
+    add_products([product])
+
+
+def add_products(products: Iterable[dict]) -> None:
+    """
+    Adds several products to the cache in a single locked update.
+
+    Args:
+        products (Iterable[dict]): The products to add
+
+    Returns:
+        None
+    """
+    new_products = list(products)
 
     def update_fn(data):
-        products = data.get("products", [])
-        products.append(product)
-        return {"products": products}
+        existing = data.get("products", [])
+        existing.extend(new_products)
+        return {"products": existing}
 
     _atomic_update_json(get_afm_cache_path(), update_fn, {"products": []})
 
@@ -299,4 +371,4 @@ def get_results_cache_path() -> str:
     Returns:
         path (str): The path to the results cache folder
     """
-    return os.path.join(get_cache_path(), "scraper_results.csv")
+    return _cache_paths(ROOT_DIR)["results"]
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import sys
+from threading import Lock
 from typing import Any, Dict, Optional
 
 from termcolor import colored
@@ -44,12 +45,21 @@ class ConfigManager:
     _config: Optional[Dict[str, Any]] = None
     _config_path: str = None
     _validated: bool = False
+    _init_lock = Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._config_path = os.path.join(ROOT_DIR, "config.json")
-            cls._load_config()
+        # Fast path: once initialized, no lock is taken
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        # Double-checked so concurrent first calls load config only once
+        with cls._init_lock:
+            if cls._instance is None:
+                instance = super(ConfigManager, cls).__new__(cls)
+                cls._config_path = os.path.join(ROOT_DIR, "config.json")
+                cls._load_config()
+                cls._instance = instance
         return cls._instance
 
     @classmethod
@@ -129,6 +139,19 @@ class ConfigManager:
         """
         return cls._validated
 
+    @classmethod
+    def _loaded_config(cls) -> Dict[str, Any]:
+        """
+        Return the cached config dict, creating the singleton on first use.
+
+        Skips the ConfigManager() call once initialized, so every getter
+        costs a class attribute read instead of an extra constructor call.
+        An unloaded config reads as empty.
+        """
+        if cls._instance is None:
+            cls()
+        return cls._config or {}
+
     @classmethod
     def get(cls, key: str, default: Any = None) -> Any:
         """
@@ -141,8 +164,7 @@ class ConfigManager:
         Returns:
             The configuration value or default
         """
-        instance = cls()
-        return instance._config.get(key, default)
+        return cls._loaded_config().get(key, default)
 
     @classmethod
     def get_with_env(cls, key: str, env_var: str, default: Any = None) -> Any:
@@ -172,8 +194,7 @@ class ConfigManager:
             return env_value
 
         # Fall back to config.json
-        instance = cls()
-        return instance._config.get(key, default)
+        return cls._loaded_config().get(key, default)
 
 
 # Global config manager instance
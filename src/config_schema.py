@@ -5,9 +5,10 @@ This module provides data validation and type checking for config.json
 to catch configuration errors early and provide clear error messages.
 """
 
-from typing import Optional
+import json
+from typing import Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from constants import (
     DEFAULT_HEADLESS,
@@ -182,7 +183,39 @@ def validate_config(config_data: dict) -> ConfigSchema:
         >>> print(validated_config.verbose)
         True
     """
-    return ConfigSchema(**config_data)
+    # model_validate hands the dict straight to the validator Pydantic
+    # compiled once for the class, without unpacking it into kwargs
+    return ConfigSchema.model_validate(config_data)
+
+
+def validate_config_bytes(raw: Union[bytes, str]) -> ConfigSchema:
+    """
+    Validate configuration from raw JSON bytes.
+
+    Args:
+        raw: JSON-encoded configuration (bytes or str)
+
+    Returns:
+        Validated ConfigSchema instance
+
+    Raises:
+        JSONDecodeError: If the data is not valid JSON
+        ValidationError: If configuration is invalid
+
+    Example:
+        >>> validated_config = validate_config_bytes(b'{"firefox_profile": "/path"}')
+        >>> print(validated_config.firefox_profile)
+        /path
+    """
+    # Parse and validate in one pass, without building an intermediate dict
+    try:
+        return ConfigSchema.model_validate_json(raw)
+    except ValidationError as e:
+        if e.errors()[0]["type"] != "json_invalid":
+            raise
+
+    # Malformed JSON: re-parse with the stdlib so callers get JSONDecodeError
+    return validate_config(json.loads(raw))
 
 
 def validate_config_file(file_path: str) -> ConfigSchema:
@@ -205,9 +238,5 @@ def validate_config_file(file_path: str) -> ConfigSchema:
         >>> print(validated_config.headless)
         False
     """
-    import json
-
-    with open(file_path, "r") as f:
-        config_data = json.load(f)
-
-    return validate_config(config_data)
+    with open(file_path, "rb") as f:
+        return validate_config_bytes(f.read())
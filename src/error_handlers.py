@@ -346,6 +346,17 @@ class ErrorContext:
         ...     ctx.set_result(data)
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "operation_name",
+        "reraise",
+        "default_return",
+        "logger",
+        "log_level",
+        "result",
+        "exception",
+    )
+
     def __init__(
         self,
         operation_name: str,
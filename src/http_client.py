@@ -217,3 +217,18 @@ def get_http_client() -> HTTPClient:
         >>> response = client.get("https://api.example.com/data")
     """
     return HTTPClient()
+
+
+def create_http_client() -> HTTPClient:
+    """
+    Create a standalone HTTP client that is not the global instance.
+
+    The client has its own session and is unaffected by reset_instance(),
+    so independent callers (e.g. tests run in parallel) don't share state.
+
+    Returns:
+        HTTPClient: A new HTTP client instance
+    """
+    client = object.__new__(HTTPClient)
+    client._initialize_session()
+    return client
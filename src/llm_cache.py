@@ -316,3 +316,15 @@ def get_llm_cache(cache_dir: Optional[str] = None, default_ttl: Optional[int] =
         _default_cache = LLMCache(cache_dir=cache_dir, default_ttl=default_ttl)
 
     return _default_cache
+
+
+def reset_llm_cache() -> None:
+    """
+    Reset the default LLM cache instance.
+
+    Useful for testing and cleanup.
+    """
+    global _default_cache
+
+    _default_cache = None
+    logging.debug("Default LLM cache reset")
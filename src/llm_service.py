@@ -28,6 +28,9 @@ class LLMService:
 
     _instances: Dict[str, "LLMService"] = {}
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("api_key", "default_model", "enable_cache", "cache", "_client")
+
     def __init__(
         self,
         api_key: str,
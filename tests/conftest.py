@@ -4,9 +4,8 @@ Pytest configuration and shared fixtures for MoneyPrinterV2 tests.
 
 import json
 import os
+import re
 import sys
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -16,10 +15,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """
+    Create a temporary directory for test files.
+
+    Backed by pytest's tmp_path, so every test gets its own subdirectory
+    under one session-wide base directory instead of a fresh mkdtemp.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -114,6 +117,16 @@ def mock_requests(monkeypatch):
     return {"get": mock_get, "post": mock_post, "response": mock_response}
 
 
+@pytest.fixture
+def logged(caplog):
+    """Return a check for whether any captured log message matches a pattern."""
+
+    def check(pattern):
+        return any(re.search(pattern, record.getMessage()) for record in caplog.records)
+
+    return check
+
+
 @pytest.fixture(autouse=True)
 def reset_config_singleton():
     """Reset ConfigManager singleton between tests."""
@@ -115,6 +115,17 @@ class TestAtomicOperations:
         result = _atomic_read_json(str(test_file), default)
         assert result == default
 
+    def test_atomic_read_json_invalid_encoding(self, temp_dir):
+        """Test reading bytes that are not valid UTF-8 returns default."""
+        from cache import _atomic_read_json
+
+        test_file = temp_dir / "binary.json"
+        test_file.write_bytes(b'{"key": "\xff\xfe"}')
+        default = {"default": True}
+
+        result = _atomic_read_json(str(test_file), default)
+        assert result == default
+
     def test_atomic_write_json(self, temp_dir):
         """Test writing JSON to file."""
         from cache import _atomic_write_json
@@ -129,6 +140,42 @@ class TestAtomicOperations:
             result = json.load(f)
         assert result == test_data
 
+    def test_atomic_write_json_replaces_longer_content(self, temp_dir):
+        """Test that writing replaces existing content instead of appending."""
+        from cache import _atomic_write_json
+
+        test_file = temp_dir / "test.json"
+        test_file.write_text(json.dumps({"items": list(range(100))}))
+
+        _atomic_write_json(str(test_file), {"items": []})
+
+        with open(test_file, "r") as f:
+            result = json.load(f)
+        assert result == {"items": []}
+
+    def test_atomic_write_json_locks_from_start(self, temp_dir):
+        """Test that the write lock is taken at byte 0, where readers lock."""
+        import cache
+
+        test_file = temp_dir / "test.json"
+        test_file.write_text(json.dumps({"existing": True}))
+        positions = []
+
+        class RecordingLock:
+            def __init__(self, file_handle):
+                positions.append(file_handle.tell())
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+        with patch.object(cache, "FileLock", RecordingLock):
+            cache._atomic_write_json(str(test_file), {"new": True})
+
+        assert positions == [0]
+
     def test_atomic_write_json_creates_directory(self, temp_dir):
         """Test that atomic_write_json creates parent directories."""
         from cache import _atomic_write_json
@@ -163,6 +210,22 @@ class TestAtomicOperations:
         assert result["count"] == 1
         assert "new_item" in result["items"]
 
+    def test_atomic_update_json_noop_skips_write(self, temp_dir):
+        """Test that an update which changes nothing does not rewrite the file."""
+        from cache import _atomic_update_json
+
+        test_file = temp_dir / "test.json"
+        with open(test_file, "w") as f:
+            json.dump({"accounts": []}, f)
+
+        # Backdate the file so any rewrite would be visible in its mtime
+        os.utime(test_file, ns=(0, 0))
+
+        _atomic_update_json(str(test_file), lambda data: data, {})
+
+        assert test_file.stat().st_mtime_ns == 0
+        assert json.loads(test_file.read_text()) == {"accounts": []}
+
     def test_atomic_update_json_creates_new_file(self, temp_dir):
         """Test that atomic_update_json creates new file if doesn't exist."""
         from cache import _atomic_update_json
@@ -232,6 +295,18 @@ class TestCachePaths:
             result = get_results_cache_path()
             assert result == "/test/root/.mp/scraper_results.csv"
 
+    def test_cache_paths_follow_root_dir(self):
+        """Test cached paths are reused per root and rebuilt when it changes."""
+        import cache
+        from cache import get_youtube_cache_path
+
+        with patch.object(cache, "ROOT_DIR", "/test/root"):
+            first = get_youtube_cache_path()
+            assert get_youtube_cache_path() is first
+
+        with patch.object(cache, "ROOT_DIR", "/other/root"):
+            assert get_youtube_cache_path() == "/other/root/.mp/youtube.json"
+
 
 class TestAccountManagement:
     """Tests for account management functions."""
@@ -279,10 +354,10 @@ class TestAccountManagement:
 
     def test_get_accounts_empty_cache(self, temp_dir):
         """Test getting accounts when cache is empty."""
-        import config
+        import cache
         from cache import get_accounts
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
             result = get_accounts("youtube")
 
         assert result == []
@@ -296,14 +371,14 @@ class TestAccountManagement:
 
     def test_add_account_youtube(self, temp_dir):
         """Test adding YouTube account."""
-        import config
+        import cache
         from cache import add_account, get_accounts
 
         # Setup
         cache_dir = temp_dir / ".mp"
         cache_dir.mkdir()
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
             new_account = {"id": "999", "name": "New Account"}
             add_account("youtube", new_account)
 
@@ -314,14 +389,14 @@ class TestAccountManagement:
 
     def test_add_account_multiple(self, temp_dir):
         """Test adding multiple accounts."""
-        import config
+        import cache
         from cache import add_account, get_accounts
 
         # Setup
         cache_dir = temp_dir / ".mp"
         cache_dir.mkdir()
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
             add_account("twitter", {"id": "1", "name": "Account 1"})
             add_account("twitter", {"id": "2", "name": "Account 2"})
 
@@ -329,6 +404,33 @@ class TestAccountManagement:
 
         assert len(accounts) == 2
 
+    def test_add_accounts_batch(self, temp_dir):
+        """Test adding several accounts in one update."""
+        import cache
+        from cache import add_account, add_accounts, get_accounts
+
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
+            add_account("youtube", {"id": "1", "name": "Account 1"})
+            add_accounts(
+                "youtube",
+                ({"id": str(i), "name": f"Account {i}"} for i in range(2, 5)),
+            )
+
+            accounts = get_accounts("youtube")
+
+        assert [acc["id"] for acc in accounts] == ["1", "2", "3", "4"]
+
+    def test_add_accounts_unknown_provider(self, temp_dir):
+        """Test batch adding accounts with unknown provider."""
+        import cache
+        from cache import add_accounts
+
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
+            # Should not raise exception or create any cache file
+            add_accounts("unknown_provider", [{"id": "1"}])
+
+        assert not (temp_dir / ".mp").exists()
+
     def test_remove_account(self, temp_dir):
         """Test removing account."""
         import cache
@@ -367,24 +469,24 @@ class TestProductManagement:
 
     def test_get_products_empty(self, temp_dir):
         """Test getting products when cache is empty."""
-        import config
+        import cache
         from cache import get_products
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
             result = get_products()
 
         assert result == []
 
     def test_add_product(self, temp_dir):
         """Test adding product."""
-        import config
+        import cache
         from cache import add_product, get_products
 
         # Setup
         cache_dir = temp_dir / ".mp"
         cache_dir.mkdir()
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
             new_product = {"id": "prod123", "name": "Test Product", "price": 99.99}
             add_product(new_product)
 
@@ -413,3 +515,16 @@ class TestProductManagement:
         assert len(products) == 3
         assert products[0]["id"] == "1"
         assert products[2]["name"] == "Product 3"
+
+    def test_add_products_batch(self, temp_dir):
+        """Test adding several products in one update."""
+        import cache
+        from cache import add_products, get_products
+
+        with patch.object(cache, "ROOT_DIR", str(temp_dir)):
+            add_products([{"id": "1"}, {"id": "2"}])
+            add_products([])
+
+            products = get_products()
+
+        assert [product["id"] for product in products] == ["1", "2"]
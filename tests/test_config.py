@@ -5,6 +5,7 @@ Unit tests for configuration management (src/config.py).
 import json
 import os
 import tempfile
+import time
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -22,6 +23,39 @@ class TestConfigManager:
 
         assert instance1 is instance2
 
+    def test_singleton_concurrent_first_access_loads_once(self):
+        """Test that concurrent first calls create one instance and load config once."""
+        import threading
+
+        from config import ConfigManager
+
+        ConfigManager._instance = None
+        ConfigManager._config = None
+        barrier = threading.Barrier(8)
+        seen = []
+
+        def slow_load(*args, **kwargs):
+            # Widen the window in which a half-initialized instance could leak
+            time.sleep(0.05)
+            ConfigManager._config = {"verbose": True}
+
+        def create():
+            barrier.wait()
+            instance = ConfigManager()
+            seen.append((instance, ConfigManager._config))
+
+        with patch.object(ConfigManager, "_load_config", side_effect=slow_load) as mock_load:
+            threads = [threading.Thread(target=create) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_load.call_count == 1
+        assert all(instance is seen[0][0] for instance, _ in seen)
+        # The instance is only published once its config has been loaded
+        assert all(config is not None for _, config in seen)
+
     def test_get_with_existing_key(self, mock_config_data):
         """Test getting a configuration value that exists."""
         from config import ConfigManager
@@ -115,11 +149,9 @@ class TestConfigGetters:
         """Setup configuration before each test."""
         from config import ConfigManager
 
-        # Create a ConfigManager instance without loading from file
-        with patch.object(ConfigManager, "_load_config"):
-            instance = ConfigManager()
-            ConfigManager._instance = instance
-            ConfigManager._config = mock_config_data
+        # Install an instance directly, bypassing __new__ and _load_config
+        ConfigManager._instance = object.__new__(ConfigManager)
+        ConfigManager._config = mock_config_data
 
     def test_get_verbose(self):
         """Test get_verbose returns correct value."""
@@ -1,7 +1,6 @@
 """Tests for error handling decorators and utilities."""
 
 import logging
-import time
 
 import pytest
 
@@ -17,36 +16,83 @@ from src.error_handlers import (
 from src.exceptions import APIError
 
 
+def _return_success():
+    return "success"
+
+
+def _raise_value_error():
+    raise ValueError("Error")
+
+
+def _raise_type_error():
+    raise TypeError("Not handled")
+
+
+# Stateless decorated targets, built once instead of inside every test
+def _fallback():
+    return "fallback"
+
+
+@fallback_on_error(_fallback)
+def _primary_succeeds():
+    return "primary"
+
+
+@fallback_on_error(_fallback)
+def _primary_fails():
+    raise ValueError("Error")
+
+
+@validate_not_none("param1", "param2", "param3")
+def _multi_param(param1, param2, param3):
+    return f"{param1}:{param2}:{param3}"
+
+
+@safe_return(default=None)
+@validate_not_none("param")
+def _validated_upper(param):
+    return param.upper()
+
+
 class TestRetryOnFailure:
     """Test the retry_on_failure decorator."""
 
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        """Record retry delays instead of sleeping for real."""
+        recorded = []
+        monkeypatch.setattr("src.error_handlers.time.sleep", recorded.append)
+        return recorded
+
     def test_successful_call_no_retry(self):
         """Test that successful calls don't retry."""
-        call_count = []
+        call_count = 0
 
         @retry_on_failure(max_attempts=3)
         def success_func():
-            call_count.append(1)
+            nonlocal call_count
+            call_count += 1
             return "success"
 
         result = success_func()
         assert result == "success"
-        assert len(call_count) == 1  # Only called once
+        assert call_count == 1  # Only called once
 
     def test_retry_on_failure(self):
         """Test that failed calls are retried."""
-        call_count = []
+        call_count = 0
 
         @retry_on_failure(max_attempts=3, delay=0.01)
         def failing_func():
-            call_count.append(1)
-            if len(call_count) < 3:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
                 raise ValueError("Not yet")
             return "success"
 
         result = failing_func()
         assert result == "success"
-        assert len(call_count) == 3  # Retried 2 times, succeeded on 3rd
+        assert call_count == 3  # Retried 2 times, succeeded on 3rd
 
     def test_retry_exhausted(self):
         """Test that exhausted retries raise exception."""
@@ -68,61 +114,55 @@ class TestRetryOnFailure:
         with pytest.raises(TypeError):
             raises_wrong_exception()
 
-    def test_exponential_backoff(self):
+    def test_exponential_backoff(self, sleeps):
         """Test that retry uses exponential backoff."""
-        call_times = []
+        call_count = 0
 
         @retry_on_failure(max_attempts=3, delay=0.1, backoff=2.0)
         def timing_test():
-            call_times.append(time.time())
-            if len(call_times) < 3:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
                 raise ValueError("Retry")
             return "done"
 
         timing_test()
 
-        # Check delays are approximately exponential (0.1s, 0.2s)
-        if len(call_times) >= 3:
-            delay1 = call_times[1] - call_times[0]
-            delay2 = call_times[2] - call_times[1]
-            assert delay1 >= 0.09  # ~0.1s with some tolerance
-            assert delay2 >= 0.18  # ~0.2s with some tolerance
+        # Delays grow exponentially (0.1s, 0.2s)
+        assert sleeps == pytest.approx([0.1, 0.2])
 
 
 class TestHandleErrors:
     """Test the handle_errors decorator."""
 
-    def test_successful_call(self):
-        """Test successful calls pass through."""
-
-        @handle_errors()
-        def success_func():
-            return "success"
-
-        result = success_func()
-        assert result == "success"
-
-    def test_error_reraised_by_default(self):
-        """Test errors are re-raised by default."""
-
-        @handle_errors()
-        def failing_func():
-            raise ValueError("Error")
-
-        with pytest.raises(ValueError, match="Error"):
-            failing_func()
-
-    def test_error_return_default(self):
-        """Test returning default value on error."""
-
-        @handle_errors(default_return="default", reraise=False)
-        def failing_func():
-            raise ValueError("Error")
-
-        result = failing_func()
-        assert result == "default"
-
-    def test_error_logged(self, caplog):
+    @pytest.mark.parametrize(
+        "kwargs,func,expected",
+        [
+            # Successful calls pass through
+            ({}, _return_success, "success"),
+            # Default value returned on error when not re-raising
+            ({"default_return": "default", "reraise": False}, _raise_value_error, "default"),
+        ],
+    )
+    def test_return_value(self, kwargs, func, expected):
+        """Test results and defaults returned by handle_errors."""
+        assert handle_errors(**kwargs)(func)() == expected
+
+    @pytest.mark.parametrize(
+        "kwargs,func,exc_type",
+        [
+            # Errors are re-raised by default
+            ({}, _raise_value_error, ValueError),
+            # Only the specified exceptions are handled
+            ({"reraise": False, "exceptions": (ValueError,)}, _raise_type_error, TypeError),
+        ],
+    )
+    def test_errors_raised(self, kwargs, func, exc_type):
+        """Test which errors handle_errors lets propagate."""
+        with pytest.raises(exc_type):
+            handle_errors(**kwargs)(func)()
+
+    def test_error_logged(self, logged):
         """Test errors are logged."""
 
         @handle_errors(reraise=False, log_level=logging.WARNING)
@@ -130,43 +170,26 @@ class TestHandleErrors:
             raise ValueError("Test error")
 
         failing_func()
-        assert "Test error" in caplog.text
-
-    def test_specific_exceptions_only(self):
-        """Test only specified exceptions are handled."""
-
-        @handle_errors(reraise=False, exceptions=(ValueError,))
-        def raises_type_error():
-            raise TypeError("Not handled")
-
-        with pytest.raises(TypeError):
-            raises_type_error()
+        assert logged("Test error")
 
 
 class TestSafeReturn:
     """Test the safe_return decorator."""
 
-    def test_returns_default_on_error(self):
-        """Test safe_return returns default on error."""
-
-        @safe_return(default=[])
-        def failing_func():
-            raise ValueError("Error")
-
-        result = failing_func()
-        assert result == []
-
-    def test_successful_return(self):
-        """Test safe_return passes through successful results."""
-
-        @safe_return(default=None)
-        def success_func():
-            return "result"
-
-        result = success_func()
-        assert result == "result"
-
-    def test_logs_errors(self, caplog):
+    @pytest.mark.parametrize(
+        "default,func,expected",
+        [
+            # Default returned on error
+            ([], _raise_value_error, []),
+            # Successful results pass through
+            (None, _return_success, "success"),
+        ],
+    )
+    def test_return_value(self, default, func, expected):
+        """Test results and defaults returned by safe_return."""
+        assert safe_return(default=default)(func)() == expected
+
+    def test_logs_errors(self, caplog, logged):
         """Test safe_return logs errors."""
         # Capture WARNING level logs (default for safe_return)
         caplog.set_level(logging.WARNING)
@@ -176,13 +199,13 @@ class TestSafeReturn:
             raise ValueError("Safe error")
 
         failing_func()
-        assert "Safe error" in caplog.text
+        assert logged("Safe error")
 
 
 class TestLogErrors:
     """Test the log_errors decorator."""
 
-    def test_logs_and_reraises(self, caplog):
+    def test_logs_and_reraises(self, logged):
         """Test log_errors logs and re-raises."""
 
         @log_errors()
@@ -192,7 +215,7 @@ class TestLogErrors:
         with pytest.raises(ValueError, match="Logged error"):
             failing_func()
 
-        assert "Logged error" in caplog.text
+        assert logged("Logged error")
 
     def test_successful_call_no_log(self, caplog):
         """Test successful calls don't log."""
@@ -245,25 +268,20 @@ class TestValidateNotNone:
 
     def test_validation_multiple_params(self):
         """Test validation of multiple parameters."""
-
-        @validate_not_none("param1", "param2", "param3")
-        def multi_param(param1, param2, param3):
-            return f"{param1}:{param2}:{param3}"
-
         # All valid
-        assert multi_param("a", "b", "c") == "a:b:c"
+        assert _multi_param("a", "b", "c") == "a:b:c"
 
         # First None
         with pytest.raises(ValueError, match="param1"):
-            multi_param(None, "b", "c")
+            _multi_param(None, "b", "c")
 
         # Middle None
         with pytest.raises(ValueError, match="param2"):
-            multi_param("a", None, "c")
+            _multi_param("a", None, "c")
 
         # Last None
         with pytest.raises(ValueError, match="param3"):
-            multi_param("a", "b", None)
+            _multi_param("a", "b", None)
 
 
 class TestFallbackOnError:
@@ -271,29 +289,11 @@ class TestFallbackOnError:
 
     def test_successful_call_no_fallback(self):
         """Test successful calls don't use fallback."""
-
-        def fallback_func():
-            return "fallback"
-
-        @fallback_on_error(fallback_func)
-        def primary_func():
-            return "primary"
-
-        result = primary_func()
-        assert result == "primary"
+        assert _primary_succeeds() == "primary"
 
     def test_error_uses_fallback(self):
         """Test errors trigger fallback function."""
-
-        def fallback_func():
-            return "fallback"
-
-        @fallback_on_error(fallback_func)
-        def failing_func():
-            raise ValueError("Error")
-
-        result = failing_func()
-        assert result == "fallback"
+        assert _primary_fails() == "fallback"
 
     def test_fallback_with_arguments(self):
         """Test fallback receives same arguments."""
@@ -308,18 +308,15 @@ class TestFallbackOnError:
         result = primary_func(10, 20)
         assert result == 130  # 10 + 20 + 100
 
-    def test_fallback_logs_message(self, caplog):
+    def test_fallback_logs_message(self, logged):
         """Test fallback logs message."""
 
-        def fallback_func():
-            return "fallback"
-
-        @fallback_on_error(fallback_func, log_message="API unavailable")
+        @fallback_on_error(_fallback, log_message="API unavailable")
         def failing_func():
             raise ValueError("Error")
 
         failing_func()
-        assert "API unavailable" in caplog.text
+        assert logged("API unavailable")
 
 
 class TestErrorContext:
@@ -347,12 +344,12 @@ class TestErrorContext:
         assert ctx.result == "default"
         assert isinstance(ctx.exception, ValueError)
 
-    def test_error_logged(self, caplog):
+    def test_error_logged(self, logged):
         """Test errors are logged."""
         with ErrorContext("Test operation", reraise=False):
             raise ValueError("Context error")
 
-        assert "Context error" in caplog.text
+        assert logged("Context error")
 
     def test_context_with_result(self):
         """Test setting result in context."""
@@ -362,35 +359,38 @@ class TestErrorContext:
 
         assert ctx.result == "computed_value"
 
+    def test_no_instance_dict(self):
+        """Test ErrorContext uses slots rather than a per-instance __dict__."""
+        ctx = ErrorContext("Test operation")
+
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.unexpected_attribute = True
+
 
 class TestIntegration:
     """Integration tests combining multiple decorators."""
 
     def test_retry_with_handle_errors(self):
         """Test combining retry_on_failure with handle_errors."""
-        call_count = []
+        call_count = 0
 
         @handle_errors(default_return="handled", reraise=False)
         @retry_on_failure(max_attempts=2, delay=0.01)
         def unstable_func():
-            call_count.append(1)
+            nonlocal call_count
+            call_count += 1
             raise ValueError("Unstable")
 
         result = unstable_func()
         assert result == "handled"
-        assert len(call_count) == 2  # Retried once
+        assert call_count == 2  # Retried once
 
     def test_validate_with_safe_return(self):
         """Test combining validate_not_none with safe_return."""
-
-        @safe_return(default=None)
-        @validate_not_none("param")
-        def validated_func(param):
-            return param.upper()
-
         # Valid call
-        assert validated_func("test") == "TEST"
+        assert _validated_upper("test") == "TEST"
 
         # Invalid call - safe_return catches validation error
-        result = validated_func(None)
+        result = _validated_upper(None)
         assert result is None
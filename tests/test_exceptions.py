@@ -1,5 +1,8 @@
 """Tests for custom exception hierarchy."""
 
+import logging
+import re
+
 import pytest
 
 from src.exceptions import (
@@ -22,6 +25,12 @@ from src.exceptions import (
     log_exception,
 )
 
+# Expected log_exception messages, compiled once at import
+_RX_VALUE_ERROR = re.compile(r"ValueError: Invalid value")
+_RX_CONNECT = re.compile(r"Failed to connect.*endpoint=https://api\.example\.com", re.DOTALL)
+_RX_CONFIG_ERROR = re.compile(r"Config error")
+_RX_TEST_ERROR = re.compile(r"ValueError: Test error")
+
 
 class TestMoneyPrinterError:
     """Test the base exception class."""
@@ -67,122 +76,90 @@ class TestMoneyPrinterError:
 class TestExceptionHierarchy:
     """Test exception inheritance hierarchy."""
 
-    def test_configuration_errors(self):
-        """Test configuration error hierarchy."""
-        exc = MissingConfigError("API key missing")
-        assert isinstance(exc, ConfigurationError)
-        assert isinstance(exc, MoneyPrinterError)
-
-        exc = InvalidConfigError("Invalid timeout value")
-        assert isinstance(exc, ConfigurationError)
-        assert isinstance(exc, MoneyPrinterError)
-
-    def test_api_errors(self):
-        """Test API error hierarchy."""
-        for exc_class in [
-            APIConnectionError,
-            APIAuthenticationError,
-            APIRateLimitError,
-            APIResponseError,
-        ]:
-            exc = exc_class("Test error")
-            assert isinstance(exc, APIError)
-            assert isinstance(exc, MoneyPrinterError)
-
-    def test_file_errors(self):
-        """Test file operation error hierarchy."""
-        exc = FileNotFoundError("File not found")
-        assert isinstance(exc, FileOperationError)
-        assert isinstance(exc, MoneyPrinterError)
-
-    def test_browser_errors(self):
-        """Test browser error hierarchy."""
-        exc = BrowserInitializationError("Failed to start browser")
-        assert isinstance(exc, BrowserError)
-        assert isinstance(exc, MoneyPrinterError)
-
-        exc = ElementNotFoundError("Button not found")
-        assert isinstance(exc, BrowserError)
-
-    def test_video_errors(self):
-        """Test video processing error hierarchy."""
-        exc = VideoProcessingError("Processing failed")
-        assert isinstance(exc, MoneyPrinterError)
-
-    def test_validation_errors(self):
-        """Test validation error hierarchy."""
-        exc = ValidationError("Validation failed")
-        assert isinstance(exc, MoneyPrinterError)
+    @pytest.mark.parametrize(
+        "exc_class,bases",
+        [
+            # Configuration errors
+            (MissingConfigError, (ConfigurationError, MoneyPrinterError)),
+            (InvalidConfigError, (ConfigurationError, MoneyPrinterError)),
+            # API errors
+            (APIConnectionError, (APIError, MoneyPrinterError)),
+            (APIAuthenticationError, (APIError, MoneyPrinterError)),
+            (APIRateLimitError, (APIError, MoneyPrinterError)),
+            (APIResponseError, (APIError, MoneyPrinterError)),
+            # File operation errors
+            (FileNotFoundError, (FileOperationError, MoneyPrinterError)),
+            # Browser errors
+            (BrowserInitializationError, (BrowserError, MoneyPrinterError)),
+            (ElementNotFoundError, (BrowserError,)),
+            # Video processing and validation errors
+            (VideoProcessingError, (MoneyPrinterError,)),
+            (ValidationError, (MoneyPrinterError,)),
+        ],
+    )
+    def test_hierarchy(self, exc_class, bases):
+        """Test each exception derives from its expected base classes."""
+        exc = exc_class("Test error")
+        for base in bases:
+            assert isinstance(exc, base)
 
 
 class TestLogException:
     """Test exception logging utility."""
 
-    def test_log_standard_exception(self, caplog):
-        """Test logging standard exceptions."""
-        import logging
-
-        exc = ValueError("Invalid value")
-        log_exception(exc, level=logging.ERROR)
-
-        assert "ValueError: Invalid value" in caplog.text
-
-    def test_log_money_printer_exception(self, caplog):
-        """Test logging MoneyPrinterError exceptions."""
-        import logging
-
-        exc = APIConnectionError("Failed to connect", endpoint="https://api.example.com")
-        log_exception(exc, level=logging.ERROR)
-
-        assert "Failed to connect" in caplog.text
-        assert "endpoint=https://api.example.com" in caplog.text
-
-    def test_log_with_custom_logger(self, caplog):
-        """Test logging with custom logger."""
-        import logging
-
-        logger = logging.getLogger("test_logger")
-        exc = ConfigurationError("Config error")
-
-        log_exception(exc, logger=logger, level=logging.WARNING)
-
-        assert "Config error" in caplog.text
-        # Check it used the custom logger
+    @pytest.mark.parametrize(
+        "exc,kwargs,expected",
+        [
+            # Standard exceptions
+            (ValueError("Invalid value"), {"level": logging.ERROR}, _RX_VALUE_ERROR),
+            # MoneyPrinterError exceptions include their context
+            (
+                APIConnectionError("Failed to connect", endpoint="https://api.example.com"),
+                {"level": logging.ERROR},
+                _RX_CONNECT,
+            ),
+            # Custom logger
+            (
+                ConfigurationError("Config error"),
+                {"logger": logging.getLogger("test_logger"), "level": logging.WARNING},
+                _RX_CONFIG_ERROR,
+            ),
+            # Without traceback
+            (
+                ValueError("Test error"),
+                {"level": logging.INFO, "include_traceback": False},
+                _RX_TEST_ERROR,
+            ),
+        ],
+    )
+    def test_log_exception(self, caplog, logged, exc, kwargs, expected):
+        """Test log_exception logs the exception at the requested level."""
+        caplog.set_level(kwargs["level"])
+
+        log_exception(exc, **kwargs)
+
+        assert logged(expected)
+        # Check the message was logged at the requested level
         for record in caplog.records:
-            if "Config error" in record.message:
-                assert record.levelno == logging.WARNING
-
-    def test_log_without_traceback(self, caplog):
-        """Test logging without traceback."""
-        import logging
-
-        # Capture INFO level logs
-        caplog.set_level(logging.INFO)
-
-        exc = ValueError("Test error")
-        log_exception(exc, level=logging.INFO, include_traceback=False)
-
-        # Message should be logged
-        assert "ValueError: Test error" in caplog.text
+            if expected.search(record.getMessage()):
+                assert record.levelno == kwargs["level"]
 
 
 class TestExceptionCatchAll:
     """Test that all custom exceptions can be caught by MoneyPrinterError."""
 
-    def test_catch_all_exceptions(self):
-        """Test catching all custom exceptions with base class."""
-        exceptions_to_test = [
-            MissingConfigError("test"),
-            APIConnectionError("test"),
-            FileNotFoundError("test"),
-            BrowserError("test"),
-            VideoProcessingError("test"),
-            ValidationError("test"),
-        ]
-
-        for exc in exceptions_to_test:
-            try:
-                raise exc
-            except MoneyPrinterError as e:
-                assert isinstance(e, MoneyPrinterError)
-                assert str(e) == "test"
+    @pytest.mark.parametrize(
+        "exc_class",
+        [
+            MissingConfigError,
+            APIConnectionError,
+            FileNotFoundError,
+            BrowserError,
+            VideoProcessingError,
+            ValidationError,
+        ],
+    )
+    def test_catch_all_exceptions(self, exc_class):
+        """Test catching each custom exception with the base class."""
+        with pytest.raises(MoneyPrinterError, match="^test$"):
+            raise exc_class("test")
@@ -2,18 +2,69 @@
 Tests for the HTTP client with connection pooling.
 """
 
-import os
-
-# Import the module under test
-import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from src.http_client import HTTPClient, create_http_client, get_http_client
+
+_URL = "https://api.example.com/data"
+
+
+def _raiser(exc):
+    """Return a raise_for_status stand-in that raises exc."""
+
+    def raise_for_status():
+        raise exc
+
+    return raise_for_status
+
+
+# Canned responses shared by the request tests
+_OK_RESPONSE = SimpleNamespace(status_code=200, raise_for_status=lambda: None)
+_NOT_FOUND = SimpleNamespace(
+    status_code=404, raise_for_status=_raiser(requests.HTTPError("404 Not Found"))
+)
+_CONNECTION_ERROR = SimpleNamespace(
+    raise_for_status=_raiser(requests.RequestException("Connection error"))
+)
+
+
+class _RecordedRequests(list):
+    """(method, url, kwargs) calls seen by the fake Session.request."""
+
+    def __init__(self):
+        super().__init__()
+        # Responses handed back in order; the last one keeps repeating
+        self.responses = [_OK_RESPONSE]
+        # Session objects the calls went through
+        self.sessions = set()
+
+
+@pytest.fixture
+def session_requests(monkeypatch):
+    """Replace requests.Session.request with a recorder returning canned responses."""
+    calls = _RecordedRequests()
+
+    def fake_request(session, method, url, **kwargs):
+        calls.append((method, url, kwargs))
+        calls.sessions.add(id(session))
+        if len(calls.responses) > 1:
+            return calls.responses.pop(0)
+        return calls.responses[0]
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return calls
 
-from http_client import HTTPClient, get_http_client  # noqa: E402
+
+@pytest.fixture(scope="module")
+def http_client():
+    """Build one standalone HTTPClient shared by the request tests in this module."""
+    client = create_http_client()
+    yield client
+    client.close()
 
 
 class TestHTTPClient:
@@ -30,14 +81,12 @@ class TestHTTPClient:
         client = get_http_client()
         assert isinstance(client, HTTPClient)
 
-    def test_session_initialized(self):
+    def test_session_initialized(self, http_client):
         """Test that session is properly initialized."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-        assert client.session is not None
-        assert isinstance(client.session, requests.Session)
+        assert http_client.session is not None
+        assert isinstance(http_client.session, requests.Session)
 
-    @patch("http_client.requests.Session")
+    @patch("src.http_client.requests.Session")
     def test_connection_pooling_configured(self, mock_session_class):
         """Test that connection pooling is properly configured."""
         HTTPClient.reset_instance()
@@ -49,107 +98,40 @@ class TestHTTPClient:
         # Verify session mount was called for both http and https
         assert mock_session.mount.call_count >= 2
 
-    @patch.object(requests.Session, "request")
-    def test_request_method(self, mock_request):
-        """Test that request method calls session.request correctly."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        # Make request
-        response = client.request("GET", "https://api.example.com/data")
-
-        # Verify request was made
-        mock_request.assert_called_once()
+    @pytest.mark.parametrize(
+        "method_name,args,kwargs,verb",
+        [
+            # Generic request method
+            ("request", ("GET", _URL), {}, "GET"),
+            # Convenience methods pick the verb
+            ("get", (_URL,), {}, "GET"),
+            ("post", (_URL,), {"json": {"key": "value"}}, "POST"),
+            # Custom headers and timeout are forwarded
+            ("request", ("GET", _URL), {"headers": {"Authorization": "Bearer token123"}}, "GET"),
+            ("request", ("GET", _URL), {"timeout": 60}, "GET"),
+        ],
+    )
+    def test_request_forwarding(
+        self, session_requests, method_name, args, kwargs, verb, http_client
+    ):
+        """Test that requests reach session.request with the right verb and arguments."""
+        response = getattr(http_client, method_name)(*args, **kwargs)
+
+        assert len(session_requests) == 1
+        method, url, sent_kwargs = session_requests[0]
+        assert method == verb
+        assert url == _URL
+        for key, value in kwargs.items():
+            assert sent_kwargs[key] == value
         assert response.status_code == 200
 
-    @patch.object(requests.Session, "request")
-    def test_get_convenience_method(self, mock_request):
-        """Test GET convenience method."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        client.get("https://api.example.com/data")
-
-        # Verify GET method was used
-        call_args = mock_request.call_args
-        assert call_args[0][0] == "GET"
-
-    @patch.object(requests.Session, "request")
-    def test_post_convenience_method(self, mock_request):
-        """Test POST convenience method."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        client.post("https://api.example.com/data", json={"key": "value"})
-
-        # Verify POST method was used
-        call_args = mock_request.call_args
-        assert call_args[0][0] == "POST"
-
-    @patch.object(requests.Session, "request")
-    def test_request_with_headers(self, mock_request):
-        """Test request with custom headers."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        headers = {"Authorization": "Bearer token123"}
-        client.request("GET", "https://api.example.com/data", headers=headers)
-
-        # Verify headers were passed
-        call_args = mock_request.call_args
-        assert "headers" in call_args[1]
-
-    @patch.object(requests.Session, "request")
-    def test_request_timeout(self, mock_request):
-        """Test that timeout is set correctly."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        client.request("GET", "https://api.example.com/data", timeout=60)
-
-        # Verify timeout was set
-        call_args = mock_request.call_args
-        assert call_args[1]["timeout"] == 60
-
-    @patch.object(requests.Session, "request")
-    def test_request_raises_on_error(self, mock_request):
+    @pytest.mark.slow
+    def test_request_raises_on_error(self, session_requests, http_client):
         """Test that request raises exception on HTTP error."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
-
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status = Mock(side_effect=requests.HTTPError("404 Not Found"))
-        mock_request.return_value = mock_response
+        session_requests.responses = [_NOT_FOUND]
 
         with pytest.raises(requests.HTTPError):
-            client.request("GET", "https://api.example.com/not-found")
+            http_client.request("GET", "https://api.example.com/not-found")
 
     @patch.object(requests.Session, "close")
     def test_close_method(self, mock_close):
@@ -174,57 +156,44 @@ class TestHTTPClient:
         # (Note: Due to singleton pattern, this might need adjustment)
         assert HTTPClient._instance is None or client1 is not client2
 
-    @patch.object(requests.Session, "request")
-    def test_retry_on_failure(self, mock_request):
-        """Test that request retries on transient failures."""
-        HTTPClient.reset_instance()
-        client = HTTPClient()
+    def test_create_http_client_is_standalone(self):
+        """Test that create_http_client bypasses the singleton."""
+        client = create_http_client()
 
-        # First call fails, second succeeds
-        mock_response_fail = Mock()
-        mock_response_fail.raise_for_status = Mock(
-            side_effect=requests.RequestException("Connection error")
-        )
-
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.raise_for_status = Mock()
+        assert client is not get_http_client()
+        assert client.session is not get_http_client().session
+        client.close()
 
-        mock_request.side_effect = [
-            mock_response_fail,
-            mock_response_success,
-        ]
+    @pytest.mark.slow
+    def test_retry_on_failure(self, session_requests, http_client):
+        """Test that request retries on transient failures."""
+        # First call fails, second succeeds
+        session_requests.responses = [_CONNECTION_ERROR, _OK_RESPONSE]
 
         # Should succeed after retry
-        response = client.request("GET", "https://api.example.com/data")
+        response = http_client.request("GET", "https://api.example.com/data")
         assert response.status_code == 200
-        assert mock_request.call_count == 2
+        assert len(session_requests) == 2
 
 
 class TestHTTPClientIntegration:
     """Integration tests for HTTP client (these would typically use mock servers)."""
 
-    @pytest.fixture(autouse=True)
-    def reset_client(self):
-        """Reset the client before each test."""
+    @pytest.fixture(scope="class")
+    def client(self):
+        """Build a fresh global client once for the class and reset it afterwards."""
         HTTPClient.reset_instance()
-        yield
+        yield get_http_client()
         HTTPClient.reset_instance()
 
-    @patch.object(requests.Session, "request")
-    def test_multiple_requests_reuse_session(self, mock_request):
+    @pytest.mark.parametrize("n", [1, 3, 10])
+    def test_multiple_requests_reuse_session(self, session_requests, client, n):
         """Test that multiple requests reuse the same session."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-
-        client = get_http_client()
+        assert get_http_client() is client
 
-        # Make multiple requests
-        client.get("https://api.example.com/1")
-        client.get("https://api.example.com/2")
-        client.post("https://api.example.com/3", json={})
+        for i in range(n):
+            client.get(f"https://api.example.com/{i}")
 
-        # All requests should use the same session
-        assert mock_request.call_count == 3
+        # Every request went through the client's one session
+        assert len(session_requests) == n
+        assert session_requests.sessions == {id(client.session)}
@@ -6,7 +6,6 @@ This module tests the LLMCache class which provides caching for LLM responses.
 
 import json
 import os
-import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -14,14 +13,74 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.exceptions import CacheError
-from src.llm_cache import LLMCache, get_llm_cache
+from src.llm_cache import LLMCache, get_llm_cache, reset_llm_cache
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path):
     """Create a temporary directory for cache testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
+
+
+class _FrozenClock:
+    """Controllable stand-in for datetime.now() in src.llm_cache."""
+
+    def __init__(self, start):
+        self.current = start
+
+    def advance(self, seconds):
+        """Move the clock forward by the given number of seconds."""
+        self.current += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze src.llm_cache's clock; tests move it with frozen_clock.advance()."""
+    clock = _FrozenClock(datetime(2024, 1, 1, 12, 0, 0))
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.current
+
+    monkeypatch.setattr("src.llm_cache.datetime", _FrozenDatetime)
+    return clock
+
+
+def _path_for(cache, prompt, **kwargs):
+    """Return the file an entry for prompt/kwargs is stored in."""
+    return cache._get_cache_path(cache._get_cache_key(prompt, **kwargs))
+
+
+def _read_cache_json(path):
+    """Parse a cache file in one read."""
+    return json.loads(Path(path).read_bytes())
+
+
+def _seed(cache, entries, now=None):
+    """Write (prompt, response, ttl) entries straight to disk, bypassing LLMCache.set."""
+    now = now or datetime.now()
+    for prompt, response, ttl in entries:
+        expires_at = None if ttl is None else (now + timedelta(seconds=ttl)).isoformat()
+        record = {
+            "prompt": prompt,
+            "model": None,
+            "response": response,
+            "cached_at": now.isoformat(),
+            "expires_at": expires_at,
+            "kwargs": {},
+        }
+        _path_for(cache, prompt).write_text(json.dumps(record))
+
+
+# Smallest record get_cache_stats() accepts; no key hashing needed to place it
+_RAW_RECORD = b'{"prompt":"","response":"","cached_at":"2024-01-01T00:00:00","expires_at":null}'
+
+
+def _seed_raw(cache, n):
+    """Write n fixed, never-expiring records under arbitrary file names."""
+    for i in range(n):
+        (cache.cache_dir / f"k{i}.json").write_bytes(_RAW_RECORD)
 
 
 @pytest.fixture
@@ -33,11 +92,11 @@ def cache(temp_cache_dir):
 class TestLLMCacheInit:
     """Tests for LLMCache initialization."""
 
-    def test_init_with_default_dir(self):
+    def test_init_with_default_dir(self, monkeypatch, tmp_path):
         """Test initialization with default cache directory."""
-        with patch("src.llm_cache.ROOT_DIR", "/tmp/test"):
-            cache = LLMCache()
-            assert str(cache.cache_dir) == "/tmp/test/cache/llm_responses"
+        monkeypatch.setattr("src.llm_cache.ROOT_DIR", str(tmp_path))
+        cache = LLMCache()
+        assert cache.cache_dir == tmp_path / "cache" / "llm_responses"
 
     def test_init_with_custom_dir(self, temp_cache_dir):
         """Test initialization with custom cache directory."""
@@ -61,68 +120,75 @@ class TestLLMCacheInit:
 class TestLLMCacheCacheKey:
     """Tests for cache key generation."""
 
-    def test_cache_key_same_for_identical_inputs(self, cache):
-        """Test that identical inputs produce the same cache key."""
-        key1 = cache._get_cache_key("Test prompt", model="gpt-4")
-        key2 = cache._get_cache_key("Test prompt", model="gpt-4")
-        assert key1 == key2
-
-    def test_cache_key_different_for_different_prompts(self, cache):
-        """Test that different prompts produce different cache keys."""
-        key1 = cache._get_cache_key("Prompt 1", model="gpt-4")
-        key2 = cache._get_cache_key("Prompt 2", model="gpt-4")
-        assert key1 != key2
-
-    def test_cache_key_different_for_different_models(self, cache):
-        """Test that different models produce different cache keys."""
-        key1 = cache._get_cache_key("Test prompt", model="gpt-4")
-        key2 = cache._get_cache_key("Test prompt", model="gpt-3.5")
-        assert key1 != key2
-
-    def test_cache_key_includes_kwargs(self, cache):
-        """Test that kwargs affect cache key."""
-        key1 = cache._get_cache_key("Test prompt", temperature=0.7)
-        key2 = cache._get_cache_key("Test prompt", temperature=0.9)
-        assert key1 != key2
+    @pytest.fixture(scope="class")
+    def key_cache(self, tmp_path_factory):
+        """Share one cache across key tests; hashing never touches the disk."""
+        return LLMCache(cache_dir=str(tmp_path_factory.mktemp("cache_keys")))
+
+    @pytest.mark.parametrize(
+        "first,second,equal",
+        [
+            # Identical inputs produce the same key
+            (("Test prompt", {"model": "gpt-4"}), ("Test prompt", {"model": "gpt-4"}), True),
+            # Different prompts produce different keys
+            (("Prompt 1", {"model": "gpt-4"}), ("Prompt 2", {"model": "gpt-4"}), False),
+            # Different models produce different keys
+            (("Test prompt", {"model": "gpt-4"}), ("Test prompt", {"model": "gpt-3.5"}), False),
+            # kwargs affect the key
+            (
+                ("Test prompt", {"temperature": 0.7}),
+                ("Test prompt", {"temperature": 0.9}),
+                False,
+            ),
+        ],
+    )
+    def test_cache_key(self, key_cache, first, second, equal):
+        """Test that cache keys match exactly when prompt, model and kwargs match."""
+        key1 = key_cache._get_cache_key(first[0], **first[1])
+        key2 = key_cache._get_cache_key(second[0], **second[1])
+        assert (key1 == key2) is equal
 
 
 class TestLLMCacheSetAndGet:
     """Tests for set and get operations."""
 
-    def test_set_and_get_basic(self, cache):
-        """Test basic set and get operations."""
-        cache.set("Test prompt", "Test response", model="gpt-4")
-        response = cache.get("Test prompt", model="gpt-4")
-        assert response == "Test response"
+    @pytest.mark.parametrize(
+        "set_kwargs,get_kwargs,expected",
+        [
+            # Basic round trip
+            ({"model": "gpt-4"}, {"model": "gpt-4"}, "Test response"),
+            # Matching kwargs hit the entry
+            (
+                {"model": "gpt-4", "temperature": 0.7},
+                {"model": "gpt-4", "temperature": 0.7},
+                "Test response",
+            ),
+            # Different kwargs should not match
+            ({"model": "gpt-4", "temperature": 0.7}, {"model": "gpt-4", "temperature": 0.9}, None),
+            # A TTL entry is retrievable immediately
+            ({"ttl": 3600}, {}, "Test response"),
+        ],
+    )
+    def test_set_and_get(self, cache, set_kwargs, get_kwargs, expected):
+        """Test set followed by get with matching and mismatching arguments."""
+        cache.set("Test prompt", "Test response", **set_kwargs)
+        assert cache.get("Test prompt", **get_kwargs) == expected
 
     def test_get_nonexistent_returns_none(self, cache):
         """Test that getting non-existent key returns None."""
         response = cache.get("Nonexistent prompt")
         assert response is None
 
-    def test_set_with_kwargs(self, cache):
-        """Test set and get with kwargs."""
-        cache.set("Test prompt", "Test response", model="gpt-4", temperature=0.7)
-        response = cache.get("Test prompt", model="gpt-4", temperature=0.7)
-        assert response == "Test response"
-
-        # Different kwargs should not match
-        response = cache.get("Test prompt", model="gpt-4", temperature=0.9)
-        assert response is None
-
     def test_set_creates_cache_file(self, cache):
         """Test that set creates a cache file."""
         cache.set("Test prompt", "Test response")
-        cache_files = list(Path(cache.cache_dir).glob("*.json"))
-        assert len(cache_files) == 1
+        assert _path_for(cache, "Test prompt").is_file()
 
     def test_cache_file_contains_correct_data(self, cache):
         """Test that cache file contains correct data."""
         cache.set("Test prompt", "Test response", model="gpt-4")
 
-        cache_files = list(Path(cache.cache_dir).glob("*.json"))
-        with open(cache_files[0], "r") as f:
-            data = json.load(f)
+        data = _read_cache_json(_path_for(cache, "Test prompt", model="gpt-4"))
 
         assert data["prompt"] == "Test prompt"
         assert data["response"] == "Test response"
@@ -133,27 +199,16 @@ class TestLLMCacheSetAndGet:
 class TestLLMCacheTTL:
     """Tests for TTL (time-to-live) functionality."""
 
-    def test_set_with_ttl(self, cache):
-        """Test setting cache with TTL."""
-        cache.set("Test prompt", "Test response", ttl=3600)
-
-        # Should be retrievable immediately
-        response = cache.get("Test prompt")
-        assert response == "Test response"
-
-    def test_expired_cache_returns_none(self, cache):
+    def test_expired_cache_returns_none(self, cache, frozen_clock):
         """Test that expired cache returns None."""
         # Set cache with 1-second TTL
         cache.set("Test prompt", "Test response", ttl=1)
 
-        # Mock datetime to be in the future
-        future_time = datetime.now() + timedelta(seconds=2)
-        with patch("src.llm_cache.datetime") as mock_datetime:
-            mock_datetime.now.return_value = future_time
-            mock_datetime.fromisoformat = datetime.fromisoformat
+        # Move past the expiry time
+        frozen_clock.advance(2)
 
-            response = cache.get("Test prompt")
-            assert response is None
+        response = cache.get("Test prompt")
+        assert response is None
 
     def test_default_ttl_used_when_not_specified(self, temp_cache_dir):
         """Test that default TTL is used when not specified."""
@@ -161,9 +216,7 @@ class TestLLMCacheTTL:
         cache.set("Test prompt", "Test response")
 
         # Check cache file has expires_at set
-        cache_files = list(Path(cache.cache_dir).glob("*.json"))
-        with open(cache_files[0], "r") as f:
-            data = json.load(f)
+        data = _read_cache_json(_path_for(cache, "Test prompt"))
 
         assert data["expires_at"] is not None
 
@@ -172,9 +225,7 @@ class TestLLMCacheTTL:
         cache.set("Test prompt", "Test response", ttl=None)
 
         # Check cache file has expires_at as None
-        cache_files = list(Path(cache.cache_dir).glob("*.json"))
-        with open(cache_files[0], "r") as f:
-            data = json.load(f)
+        data = _read_cache_json(_path_for(cache, "Test prompt"))
 
         assert data["expires_at"] is None
 
@@ -202,9 +253,7 @@ class TestLLMCacheClear:
     def test_clear_all(self, cache):
         """Test clearing all cache entries."""
         # Add multiple entries
-        cache.set("Prompt 1", "Response 1")
-        cache.set("Prompt 2", "Response 2")
-        cache.set("Prompt 3", "Response 3")
+        _seed(cache, [(f"Prompt {i}", f"Response {i}", None) for i in (1, 2, 3)])
 
         # Clear all
         count = cache.clear()
@@ -215,22 +264,25 @@ class TestLLMCacheClear:
         assert cache.get("Prompt 2") is None
         assert cache.get("Prompt 3") is None
 
-    def test_clear_expired(self, cache):
+    def test_clear_expired(self, cache, frozen_clock):
         """Test clearing only expired entries."""
         # Add entries with different TTLs
-        cache.set("Prompt 1", "Response 1", ttl=3600)  # Not expired
-        cache.set("Prompt 2", "Response 2", ttl=1)  # Will expire
-        cache.set("Prompt 3", "Response 3", ttl=None)  # Never expires
-
-        # Mock time to make entry 2 expire
-        future_time = datetime.now() + timedelta(seconds=2)
-        with patch("src.llm_cache.datetime") as mock_datetime:
-            mock_datetime.now.return_value = future_time
-            mock_datetime.fromisoformat = datetime.fromisoformat
-
-            count = cache.clear_expired()
-            # Only expired entry should be deleted
-            assert count >= 1  # At least the expired one
+        _seed(
+            cache,
+            [
+                ("Prompt 1", "Response 1", 3600),  # Not expired
+                ("Prompt 2", "Response 2", 1),  # Will expire
+                ("Prompt 3", "Response 3", None),  # Never expires
+            ],
+            now=frozen_clock.current,
+        )
+
+        # Move time forward so entry 2 expires
+        frozen_clock.advance(2)
+
+        count = cache.clear_expired()
+        # Only the expired entry should be deleted
+        assert count == 1
 
         # Verify non-expired entries still exist
         assert cache.get("Prompt 1") is not None
@@ -250,41 +302,44 @@ class TestLLMCacheStats:
 
     def test_get_cache_stats_with_entries(self, cache):
         """Test getting stats with cache entries."""
-        cache.set("Prompt 1", "Response 1")
-        cache.set("Prompt 2", "Response 2")
-        cache.set("Prompt 3", "Response 3")
+        _seed_raw(cache, 3)
 
         stats = cache.get_cache_stats()
         assert stats["total_entries"] == 3
-        assert stats["total_size_bytes"] > 0
+        assert stats["valid_entries"] == 3
+        assert stats["total_size_bytes"] == 3 * len(_RAW_RECORD)
         assert "cache_dir" in stats
 
 
 class TestLLMCacheGlobalSingleton:
     """Tests for global singleton pattern."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_default_cache(self):
+        """Start and finish each test without a default cache."""
+        reset_llm_cache()
+        yield
+        reset_llm_cache()
+
     def test_get_llm_cache_returns_same_instance(self):
         """Test that get_llm_cache returns the same instance."""
-        # Reset global cache
-        import src.llm_cache
-
-        src.llm_cache._default_cache = None
-
         cache1 = get_llm_cache()
         cache2 = get_llm_cache()
         assert cache1 is cache2
 
     def test_get_llm_cache_uses_parameters_on_first_call(self, temp_cache_dir):
         """Test that parameters are used only on first call."""
-        # Reset global cache
-        import src.llm_cache
-
-        src.llm_cache._default_cache = None
-
         cache = get_llm_cache(cache_dir=temp_cache_dir, default_ttl=7200)
         assert str(cache.cache_dir) == temp_cache_dir
         assert cache.default_ttl == 7200
 
+    def test_reset_llm_cache(self, temp_cache_dir):
+        """Test that reset_llm_cache drops the default instance."""
+        cache1 = get_llm_cache(cache_dir=temp_cache_dir)
+        reset_llm_cache()
+
+        assert get_llm_cache(cache_dir=temp_cache_dir) is not cache1
+
 
 class TestLLMCacheErrorHandling:
     """Tests for error handling."""
@@ -2,34 +2,60 @@
 Unit tests for LLM Service (src/llm_service.py).
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
+from llm_service import LLMService, create_llm_service
 
-class TestLLMService:
-    """Tests for LLMService class."""
 
-    def teardown_method(self):
-        """Reset instances after each test."""
-        from llm_service import LLMService
+@pytest.fixture(autouse=True)
+def reset_llm_service():
+    """Reset cached LLMService instances after each test."""
+    yield
+    LLMService.reset_instances()
 
-        LLMService.reset_instances()
+
+@pytest.fixture
+def mock_mistral_class(monkeypatch):
+    """Replace the Mistral client class used by llm_service with a Mock."""
+    mistral_class = Mock()
+    monkeypatch.setattr("llm_service.Mistral", mistral_class)
+    return mistral_class
+
+
+def _make_response(content):
+    """Build a chat completion response carrying the given text."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _make_mistral_stub(content):
+    """Build a Mistral client whose chat.complete returns a response with content."""
+    return SimpleNamespace(
+        chat=SimpleNamespace(complete=Mock(return_value=_make_response(content)))
+    )
+
+
+class TestLLMService:
+    """Tests for LLMService class."""
 
     def test_initialization(self):
         """Test LLM service initialization."""
-        from llm_service import LLMService
-
         service = LLMService(api_key="test-key", default_model="mistral-large-latest")
 
         assert service.api_key == "test-key"
         assert service.default_model == "mistral-large-latest"
         assert service._client is None
 
+    def test_no_instance_dict(self):
+        """Test that LLMService stores its attributes in slots."""
+        service = LLMService(api_key="test-key")
+
+        assert not hasattr(service, "__dict__")
+
     def test_get_instance_creates_new(self):
         """Test that get_instance creates new instance."""
-        from llm_service import LLMService
-
         service1 = LLMService.get_instance(api_key="key1")
         service2 = LLMService.get_instance(api_key="key2")
 
@@ -39,8 +65,6 @@ class TestLLMService:
 
     def test_get_instance_returns_cached(self):
         """Test that get_instance returns cached instance for same key."""
-        from llm_service import LLMService
-
         service1 = LLMService.get_instance(api_key="test-key")
         service2 = LLMService.get_instance(api_key="test-key")
 
@@ -48,18 +72,13 @@ class TestLLMService:
 
     def test_get_instance_with_model(self):
         """Test get_instance with custom model."""
-        from llm_service import LLMService
-
         service = LLMService.get_instance(api_key="test-key", default_model="mistral-small-latest")
 
         assert service.default_model == "mistral-small-latest"
 
-    @patch("llm_service.Mistral")
     def test_client_property_lazy_initialization(self, mock_mistral_class):
         """Test that client is lazily initialized."""
-        from llm_service import LLMService
-
-        mock_client = MagicMock()
+        mock_client = Mock()
         mock_mistral_class.return_value = mock_client
 
         service = LLMService(api_key="test-key")
@@ -74,12 +93,9 @@ class TestLLMService:
         assert client is mock_client
         mock_mistral_class.assert_called_once_with(api_key="test-key")
 
-    @patch("llm_service.Mistral")
     def test_client_property_cached(self, mock_mistral_class):
         """Test that client is cached after first access."""
-        from llm_service import LLMService
-
-        mock_client = MagicMock()
+        mock_client = Mock()
         mock_mistral_class.return_value = mock_client
 
         service = LLMService(api_key="test-key")
@@ -97,117 +113,49 @@ class TestLLMService:
 class TestChatCompletion:
     """Tests for chat_completion method."""
 
-    def teardown_method(self):
-        """Reset instances after each test."""
-        from llm_service import LLMService
-
-        LLMService.reset_instances()
-
-    @patch("llm_service.Mistral")
-    def test_chat_completion_success(self, mock_mistral_class):
-        """Test successful chat completion."""
-        from llm_service import LLMService
-
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "This is the AI response"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
+    @pytest.mark.parametrize(
+        "call_kwargs,expected_kwargs",
+        [
+            # Defaults
+            ({}, {"model": "mistral-medium-latest", "temperature": 0.7}),
+            # Custom model
+            (
+                {"model": "mistral-large-latest"},
+                {"model": "mistral-large-latest", "temperature": 0.7},
+            ),
+            # Custom temperature
+            ({"temperature": 0.3}, {"model": "mistral-medium-latest", "temperature": 0.3}),
+            # Max tokens is only sent when given
+            (
+                {"max_tokens": 100},
+                {"model": "mistral-medium-latest", "temperature": 0.7, "max_tokens": 100},
+            ),
+        ],
+    )
+    def test_chat_completion(self, mock_mistral_class, call_kwargs, expected_kwargs):
+        """Test chat completion returns the response text and forwards its parameters."""
+        mock_client = _make_mistral_stub("This is the AI response")
         mock_mistral_class.return_value = mock_client
 
-        # Create service and make request
         service = LLMService(api_key="test-key")
         messages = [
             {"role": "system", "content": "You are helpful"},
             {"role": "user", "content": "Hello"},
         ]
 
-        result = service.chat_completion(messages)
+        result = service.chat_completion(messages, **call_kwargs)
 
         # Verify result
         assert result == "This is the AI response"
 
         # Verify API was called correctly
-        mock_client.chat.complete.assert_called_once_with(
-            model="mistral-medium-latest", messages=messages, temperature=0.7
-        )
-
-    @patch("llm_service.Mistral")
-    def test_chat_completion_with_custom_model(self, mock_mistral_class):
-        """Test chat completion with custom model."""
-        from llm_service import LLMService
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Response"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
-        mock_mistral_class.return_value = mock_client
-
-        service = LLMService(api_key="test-key")
-        messages = [{"role": "user", "content": "Test"}]
-
-        result = service.chat_completion(messages, model="mistral-large-latest")
+        mock_client.chat.complete.assert_called_once_with(messages=messages, **expected_kwargs)
 
-        mock_client.chat.complete.assert_called_once_with(
-            model="mistral-large-latest", messages=messages, temperature=0.7
-        )
-
-    @patch("llm_service.Mistral")
-    def test_chat_completion_with_temperature(self, mock_mistral_class):
-        """Test chat completion with custom temperature."""
-        from llm_service import LLMService
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Response"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
-        mock_mistral_class.return_value = mock_client
-
-        service = LLMService(api_key="test-key")
-        messages = [{"role": "user", "content": "Test"}]
-
-        result = service.chat_completion(messages, temperature=0.3)
-
-        mock_client.chat.complete.assert_called_once_with(
-            model="mistral-medium-latest", messages=messages, temperature=0.3
-        )
-
-    @patch("llm_service.Mistral")
-    def test_chat_completion_with_max_tokens(self, mock_mistral_class):
-        """Test chat completion with max tokens."""
-        from llm_service import LLMService
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Response"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
-        mock_mistral_class.return_value = mock_client
-
-        service = LLMService(api_key="test-key")
-        messages = [{"role": "user", "content": "Test"}]
-
-        result = service.chat_completion(messages, max_tokens=100)
-
-        mock_client.chat.complete.assert_called_once_with(
-            model="mistral-medium-latest", messages=messages, temperature=0.7, max_tokens=100
-        )
-
-    @patch("llm_service.Mistral")
     def test_chat_completion_exception(self, mock_mistral_class):
         """Test chat completion handles exceptions."""
-        from llm_service import LLMService
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.side_effect = Exception("API Error")
+        mock_client = _make_mistral_stub(None)
         mock_mistral_class.return_value = mock_client
+        mock_client.chat.complete.side_effect = Exception("API Error")
 
         service = LLMService(api_key="test-key")
         messages = [{"role": "user", "content": "Test"}]
@@ -219,23 +167,9 @@ class TestChatCompletion:
 class TestGenerateScript:
     """Tests for generate_script convenience method."""
 
-    def teardown_method(self):
-        """Reset instances after each test."""
-        from llm_service import LLMService
-
-        LLMService.reset_instances()
-
-    @patch("llm_service.Mistral")
     def test_generate_script(self, mock_mistral_class):
         """Test generate_script convenience method."""
-        from llm_service import LLMService
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Generated script content"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
+        mock_client = _make_mistral_stub("Generated script content")
         mock_mistral_class.return_value = mock_client
 
         service = LLMService(api_key="test-key")
@@ -247,26 +181,14 @@ class TestGenerateScript:
         assert result == "Generated script content"
 
         # Verify messages were formatted correctly
-        call_args = mock_client.chat.complete.call_args
-        messages = call_args[1]["messages"]
-
-        assert len(messages) == 2
-        assert messages[0]["role"] == "system"
-        assert messages[0]["content"] == "You are a script writer"
-        assert messages[1]["role"] == "user"
-        assert messages[1]["content"] == "Write a script about AI"
+        assert mock_client.chat.complete.call_args[1]["messages"] == [
+            {"role": "system", "content": "You are a script writer"},
+            {"role": "user", "content": "Write a script about AI"},
+        ]
 
-    @patch("llm_service.Mistral")
     def test_generate_script_with_custom_model(self, mock_mistral_class):
         """Test generate_script with custom model."""
-        from llm_service import LLMService
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Script"
-
-        mock_client = MagicMock()
-        mock_client.chat.complete.return_value = mock_response
+        mock_client = _make_mistral_stub("Script")
         mock_mistral_class.return_value = mock_client
 
         service = LLMService(api_key="test-key")
@@ -284,18 +206,17 @@ class TestResetInstances:
 
     def test_reset_instances(self):
         """Test that reset_instances clears all cached instances."""
-        from llm_service import LLMService
+        # Seed the cache directly; only the cache bookkeeping is under test
+        service1 = object.__new__(LLMService)
+        LLMService._instances["key1"] = service1
+        LLMService._instances["key2"] = object.__new__(LLMService)
 
-        # Create some instances
-        service1 = LLMService.get_instance(api_key="key1")
-        service2 = LLMService.get_instance(api_key="key2")
-
-        assert len(LLMService._instances) == 2
+        assert LLMService._instances
 
         # Reset
         LLMService.reset_instances()
 
-        assert len(LLMService._instances) == 0
+        assert not LLMService._instances
 
         # New instances should be different
         service3 = LLMService.get_instance(api_key="key1")
@@ -305,16 +226,8 @@ class TestResetInstances:
 class TestConvenienceFunction:
     """Tests for create_llm_service convenience function."""
 
-    def teardown_method(self):
-        """Reset instances after each test."""
-        from llm_service import LLMService
-
-        LLMService.reset_instances()
-
     def test_create_llm_service(self):
         """Test create_llm_service convenience function."""
-        from llm_service import create_llm_service
-
         service = create_llm_service(api_key="test-key")
 
         assert service.api_key == "test-key"
@@ -322,16 +235,12 @@ class TestConvenienceFunction:
 
     def test_create_llm_service_with_model(self):
         """Test create_llm_service with custom model."""
-        from llm_service import create_llm_service
-
         service = create_llm_service(api_key="test-key", model="mistral-small-latest")
 
         assert service.default_model == "mistral-small-latest"
 
     def test_create_llm_service_returns_cached(self):
         """Test that create_llm_service returns cached instance."""
-        from llm_service import create_llm_service
-
         service1 = create_llm_service(api_key="test-key")
         service2 = create_llm_service(api_key="test-key")
 
@@ -6,7 +6,7 @@ and can be used for type checking and dependency injection.
 """
 
 from typing import Any, Dict, List, Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 
@@ -21,13 +21,78 @@ from src.protocols import (
 )
 
 
+# Example consumers of the protocol interfaces, used by TestProtocolInteroperability
+class _VideoGenerator:
+    """Example class that accepts protocol interfaces."""
+
+    def __init__(
+        self,
+        browser: BrowserProtocol,
+        http_client: HTTPClientProtocol,
+        llm_service: LLMServiceProtocol,
+        cache: CacheProtocol,
+    ):
+        self.browser = browser
+        self.http_client = http_client
+        self.llm_service = llm_service
+        self.cache = cache
+
+    def generate(self):
+        # Check cache first
+        cached = self.cache.get("script")
+        if cached:
+            return cached
+
+        # Generate new content
+        script = self.llm_service.generate_response("Generate a script")
+        self.cache.set("script", script)
+        return script
+
+
+def _fetch_and_cache_data(http_client: HTTPClientProtocol, cache: CacheProtocol, url: str):
+    """Function that uses protocol interfaces."""
+    # Check cache
+    cached = cache.get(url)
+    if cached:
+        return cached
+
+    # Fetch from HTTP
+    response = http_client.get(url)
+    data = response.text
+
+    # Cache the result
+    cache.set(url, data, ttl=3600)
+    return data
+
+
+class TestProtocolDefinitions:
+    """Tests that each protocol declares the methods its mocks stand in for."""
+
+    @pytest.mark.parametrize(
+        "protocol,methods",
+        [
+            (BrowserProtocol, ("get", "quit", "find_element", "find_elements")),
+            (HTTPClientProtocol, ("get", "post")),
+            (ConfigProviderProtocol, ("get", "get_all")),
+            (LLMServiceProtocol, ("generate_response",)),
+            (CacheProtocol, ("get", "set", "delete", "exists")),
+            (StorageProtocol, ("save", "load", "exists", "delete")),
+            (BrowserFactoryProtocol, ("create_browser",)),
+        ],
+    )
+    def test_protocol_methods(self, protocol, methods):
+        """Test that the protocol defines every method the mocks below replace."""
+        for method in methods:
+            assert callable(getattr(protocol, method, None))
+
+
 class TestBrowserProtocol:
     """Tests for BrowserProtocol interface."""
 
     def test_browser_protocol_with_mock(self):
         """Test that a mock object satisfies BrowserProtocol."""
         # Create a mock browser
-        mock_browser = Mock(spec=BrowserProtocol)
+        mock_browser = Mock()
         mock_browser.get = Mock()
         mock_browser.quit = Mock()
         mock_browser.find_element = Mock(return_value=Mock())
@@ -52,7 +117,7 @@ class TestHTTPClientProtocol:
 
     def test_http_client_protocol_with_mock(self):
         """Test that a mock object satisfies HTTPClientProtocol."""
-        mock_client = Mock(spec=HTTPClientProtocol)
+        mock_client = Mock()
         mock_response = Mock(status_code=200, text="OK")
         mock_client.get = Mock(return_value=mock_response)
         mock_client.post = Mock(return_value=mock_response)
@@ -75,10 +140,13 @@ class TestConfigProviderProtocol:
 
     def test_config_provider_protocol_with_mock(self):
         """Test that a mock object satisfies ConfigProviderProtocol."""
-        mock_config = Mock(spec=ConfigProviderProtocol)
-        mock_config.get = Mock(
-            side_effect=lambda k, default=None: {"api_key": "test123"}.get(k, default)
-        )
+        mock_config = Mock()
+        config_data = {"api_key": "test123"}
+
+        def _get(key, default=None):
+            return config_data.get(key, default)
+
+        mock_config.get = Mock(side_effect=_get)
         mock_config.get_all = Mock(return_value={"api_key": "test123", "timeout": 30})
 
         # Test get with default
@@ -99,7 +167,7 @@ class TestLLMServiceProtocol:
 
     def test_llm_service_protocol_with_mock(self):
         """Test that a mock object satisfies LLMServiceProtocol."""
-        mock_llm = Mock(spec=LLMServiceProtocol)
+        mock_llm = Mock()
         mock_llm.generate_response = Mock(return_value="Generated text response")
 
         # Test generate_response
@@ -113,7 +181,7 @@ class TestCacheProtocol:
 
     def test_cache_protocol_with_mock(self):
         """Test that a mock object satisfies CacheProtocol."""
-        mock_cache = Mock(spec=CacheProtocol)
+        mock_cache = Mock()
         mock_cache.get = Mock(return_value="cached_value")
         mock_cache.set = Mock()
         mock_cache.delete = Mock()
@@ -141,7 +209,7 @@ class TestStorageProtocol:
 
     def test_storage_protocol_with_mock(self):
         """Test that a mock object satisfies StorageProtocol."""
-        mock_storage = Mock(spec=StorageProtocol)
+        mock_storage = Mock()
         mock_storage.save = Mock()
         mock_storage.load = Mock(return_value="file content")
         mock_storage.exists = Mock(return_value=True)
@@ -169,8 +237,8 @@ class TestBrowserFactoryProtocol:
 
     def test_browser_factory_protocol_with_mock(self):
         """Test that a mock object satisfies BrowserFactoryProtocol."""
-        mock_factory = Mock(spec=BrowserFactoryProtocol)
-        mock_browser = Mock(spec=BrowserProtocol)
+        mock_factory = Mock()
+        mock_browser = Mock()
         mock_factory.create_browser = Mock(return_value=mock_browser)
 
         # Test create_browser
@@ -184,43 +252,17 @@ class TestProtocolInteroperability:
 
     def test_protocols_enable_dependency_injection(self):
         """Test that protocols enable clean dependency injection."""
-
-        # Example class that accepts protocol interfaces
-        class VideoGenerator:
-            def __init__(
-                self,
-                browser: BrowserProtocol,
-                http_client: HTTPClientProtocol,
-                llm_service: LLMServiceProtocol,
-                cache: CacheProtocol,
-            ):
-                self.browser = browser
-                self.http_client = http_client
-                self.llm_service = llm_service
-                self.cache = cache
-
-            def generate(self):
-                # Check cache first
-                cached = self.cache.get("script")
-                if cached:
-                    return cached
-
-                # Generate new content
-                script = self.llm_service.generate_response("Generate a script")
-                self.cache.set("script", script)
-                return script
-
         # Create mock dependencies
-        mock_browser = Mock(spec=BrowserProtocol)
-        mock_http = Mock(spec=HTTPClientProtocol)
-        mock_llm = Mock(spec=LLMServiceProtocol)
+        mock_browser = Mock()
+        mock_http = Mock()
+        mock_llm = Mock()
         mock_llm.generate_response = Mock(return_value="New script")
-        mock_cache = Mock(spec=CacheProtocol)
+        mock_cache = Mock()
         mock_cache.get = Mock(return_value=None)
         mock_cache.set = Mock()
 
         # Inject dependencies
-        generator = VideoGenerator(
+        generator = _VideoGenerator(
             browser=mock_browser, http_client=mock_http, llm_service=mock_llm, cache=mock_cache
         )
 
@@ -233,33 +275,16 @@ class TestProtocolInteroperability:
 
     def test_protocols_enable_easy_testing(self):
         """Test that protocols make testing easier."""
-
-        # Another example showing testability
-        def fetch_and_cache_data(http_client: HTTPClientProtocol, cache: CacheProtocol, url: str):
-            """Function that uses protocol interfaces."""
-            # Check cache
-            cached = cache.get(url)
-            if cached:
-                return cached
-
-            # Fetch from HTTP
-            response = http_client.get(url)
-            data = response.text
-
-            # Cache the result
-            cache.set(url, data, ttl=3600)
-            return data
-
         # Create mocks
-        mock_http = Mock(spec=HTTPClientProtocol)
+        mock_http = Mock()
         mock_response = Mock(text="Response data")
         mock_http.get = Mock(return_value=mock_response)
-        mock_cache = Mock(spec=CacheProtocol)
+        mock_cache = Mock()
         mock_cache.get = Mock(return_value=None)
         mock_cache.set = Mock()
 
         # Test the function
-        result = fetch_and_cache_data(mock_http, mock_cache, "https://example.com")
+        result = _fetch_and_cache_data(mock_http, mock_cache, "https://example.com")
         assert result == "Response data"
         mock_http.get.assert_called_once_with("https://example.com")
         mock_cache.set.assert_called_once()
@@ -2,23 +2,38 @@
 Unit tests for utility functions (src/utils.py).
 """
 
+import functools
+import io
 import os
 import platform
+import subprocess
 import zipfile
 from pathlib import Path
-from unittest.mock import MagicMock, call, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+import requests
+
+import utils
+from utils import (
+    build_url,
+    choose_random_song,
+    close_running_selenium_instances,
+    fetch_songs,
+    rem_temp_files,
+)
+
+# Resolved once at import for the platform-specific skipif markers
+_IS_WINDOWS = platform.system() == "Windows"
 
 
 class TestCloseSeleniumInstances:
     """Tests for close_running_selenium_instances function."""
 
-    @pytest.mark.skipif(platform.system() != "Windows", reason="Windows-specific test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows-specific test")
     def test_close_selenium_windows(self):
         """Test closing Selenium instances on Windows."""
-        from utils import close_running_selenium_instances
-
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
 
@@ -28,11 +43,9 @@ class TestCloseSeleniumInstances:
                 ["taskkill", "/f", "/im", "firefox.exe"], check=False, capture_output=True
             )
 
-    @pytest.mark.skipif(platform.system() == "Windows", reason="Unix-specific test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix-specific test")
     def test_close_selenium_unix(self):
         """Test closing Selenium instances on Unix."""
-        from utils import close_running_selenium_instances
-
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
 
@@ -42,18 +55,12 @@ class TestCloseSeleniumInstances:
 
     def test_close_selenium_subprocess_error(self):
         """Test handling subprocess error when closing Selenium."""
-        import subprocess
-
-        from utils import close_running_selenium_instances
-
         with patch("subprocess.run", side_effect=subprocess.SubprocessError("Process error")):
             # Should not raise exception, just log error
             close_running_selenium_instances()
 
     def test_close_selenium_general_exception(self):
         """Test handling general exception when closing Selenium."""
-        from utils import close_running_selenium_instances
-
         with patch("subprocess.run", side_effect=Exception("Unexpected error")):
             # Should not raise exception, just log error
             close_running_selenium_instances()
@@ -62,50 +69,38 @@ class TestCloseSeleniumInstances:
 class TestBuildUrl:
     """Tests for build_url function."""
 
-    def test_build_url_valid_id(self):
-        """Test building URL with valid YouTube video ID."""
-        from utils import build_url
-
-        video_id = "dQw4w9WgXcQ"
-        result = build_url(video_id)
-
-        assert result == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-
-    def test_build_url_different_ids(self):
-        """Test building URLs with different video IDs."""
-        from utils import build_url
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "video_id,expected_url",
+        [
+            ("dQw4w9WgXcQ", "https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
             ("abc123", "https://www.youtube.com/watch?v=abc123"),
             ("XyZ-789", "https://www.youtube.com/watch?v=XyZ-789"),
             ("test_video", "https://www.youtube.com/watch?v=test_video"),
-        ]
-
-        for video_id, expected_url in test_cases:
-            result = build_url(video_id)
-            assert result == expected_url
+        ],
+    )
+    def test_build_url(self, video_id, expected_url):
+        """Test building URLs from YouTube video IDs."""
+        assert build_url(video_id) == expected_url
 
 
+@pytest.mark.xdist_group("utils_fs")
 class TestRemTempFiles:
     """Tests for rem_temp_files function."""
 
-    def test_rem_temp_files(self, temp_dir):
+    def test_rem_temp_files(self, tmp_path):
         """Test removing temporary files while keeping JSON files."""
-        import utils
-        from utils import rem_temp_files
-
         # Setup .mp directory with various files
-        mp_dir = temp_dir / ".mp"
+        mp_dir = tmp_path / ".mp"
         mp_dir.mkdir()
 
         # Create test files
-        (mp_dir / "cache.json").write_text("{}")
-        (mp_dir / "data.json").write_text("{}")
-        (mp_dir / "temp1.txt").write_text("temp")
-        (mp_dir / "temp2.mp4").write_text("video")
-        (mp_dir / "image.png").write_text("image")
+        (mp_dir / "cache.json").touch()
+        (mp_dir / "data.json").touch()
+        (mp_dir / "temp1.txt").touch()
+        (mp_dir / "temp2.mp4").touch()
+        (mp_dir / "image.png").touch()
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(tmp_path)):
             rem_temp_files()
 
         # Check that JSON files remain
@@ -117,124 +112,115 @@ class TestRemTempFiles:
         assert not (mp_dir / "temp2.mp4").exists()
         assert not (mp_dir / "image.png").exists()
 
-    def test_rem_temp_files_empty_directory(self, temp_dir):
+    def test_rem_temp_files_empty_directory(self, tmp_path):
         """Test removing temp files from empty directory."""
-        import config
-        from utils import rem_temp_files
-
-        mp_dir = temp_dir / ".mp"
+        mp_dir = tmp_path / ".mp"
         mp_dir.mkdir()
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(tmp_path)):
             # Should not raise exception
             rem_temp_files()
 
 
+@functools.lru_cache(maxsize=1)
+def _small_zip_bytes():
+    """Build a small uncompressed songs archive once per session."""
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("test_song.mp3", b"fake audio data")
+    return zip_bytes.getvalue()
+
+
+@pytest.fixture(scope="module")
+def zip_response():
+    """Build one download response carrying a small songs archive."""
+    return SimpleNamespace(content=_small_zip_bytes())
+
+
+@pytest.mark.xdist_group("utils_fs")
 class TestFetchSongs:
     """Tests for fetch_songs function."""
 
-    def test_fetch_songs_directory_exists(self, temp_dir):
+    def test_fetch_songs_directory_exists(self, tmp_path, monkeypatch):
         """Test that fetch_songs skips download if directory exists."""
-        import utils
-        from utils import fetch_songs
-
-        # Create Songs directory
-        songs_dir = temp_dir / "Songs"
+        # Create Songs directory with a song already in it
+        songs_dir = tmp_path / "Songs"
         songs_dir.mkdir()
+        (songs_dir / "song.mp3").touch()
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
-            with patch("requests.get") as mock_get:
-                fetch_songs()
-
-                # Should not make request if directory exists
-                mock_get.assert_not_called()
-
-    def test_fetch_songs_downloads_and_extracts(self, temp_dir):
-        """Test that fetch_songs downloads and extracts songs."""
-        # Mock response with actual zip content
-        import io
+        client = SimpleNamespace(get=MagicMock())
+        monkeypatch.setattr(utils, "get_http_client", lambda: client)
+        monkeypatch.setattr(utils, "ROOT_DIR", str(tmp_path))
 
-        import utils
-        from utils import fetch_songs
+        fetch_songs()
 
-        mock_zip_bytes = io.BytesIO()
-        with zipfile.ZipFile(mock_zip_bytes, "w") as zf:
-            zf.writestr("test_song.mp3", "fake audio data")
-        mock_zip_bytes.seek(0)
+        # Should not make request if directory exists
+        client.get.assert_not_called()
 
-        mock_response = MagicMock()
-        mock_response.content = mock_zip_bytes.read()
+    def test_fetch_songs_downloads_and_extracts(self, tmp_path, monkeypatch, zip_response):
+        """Test that fetch_songs downloads and extracts songs."""
+        # fetch_songs downloads through the shared HTTP client
+        client = SimpleNamespace(get=lambda url: zip_response)
+        monkeypatch.setattr(utils, "get_http_client", lambda: client)
+        monkeypatch.setattr(utils, "ROOT_DIR", str(tmp_path))
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
-            with patch("requests.get", return_value=mock_response):
-                fetch_songs()
+        fetch_songs()
 
-                # Verify directory was created
-                songs_dir = temp_dir / "Songs"
-                assert songs_dir.exists()
+        # The archive is extracted into Songs/ and then removed
+        songs_dir = tmp_path / "Songs"
+        assert (songs_dir / "test_song.mp3").read_bytes() == b"fake audio data"
+        assert not (songs_dir / "songs.zip").exists()
 
-    def test_fetch_songs_network_error(self, temp_dir):
+    def test_fetch_songs_network_error(self, tmp_path, monkeypatch):
         """Test handling network error when fetching songs."""
-        import requests
 
-        import config
-        from utils import fetch_songs
+        def get(url):
+            raise requests.RequestException("Network error")
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
-            with patch("requests.get", side_effect=requests.RequestException("Network error")):
-                # Should not raise exception, just log error
-                fetch_songs()
+        monkeypatch.setattr(utils, "get_http_client", lambda: SimpleNamespace(get=get))
+        monkeypatch.setattr(utils, "ROOT_DIR", str(tmp_path))
 
-    def test_fetch_songs_bad_zip(self, temp_dir):
-        """Test handling bad zip file when fetching songs."""
-        import config
-        from utils import fetch_songs
+        # Should not raise exception, just log error
+        fetch_songs()
 
-        mock_response = MagicMock()
-        mock_response.content = b"not a real zip"
+    def test_fetch_songs_bad_zip(self, tmp_path, monkeypatch, zip_response):
+        """Test handling bad zip file when fetching songs."""
+        client = SimpleNamespace(get=lambda url: zip_response)
+        monkeypatch.setattr(utils, "get_http_client", lambda: client)
+        monkeypatch.setattr(utils, "ROOT_DIR", str(tmp_path))
 
-        with patch.object(config, "ROOT_DIR", str(temp_dir)):
-            with patch("requests.get", return_value=mock_response):
-                with patch("zipfile.ZipFile", side_effect=zipfile.BadZipFile("Bad zip")):
-                    with patch("builtins.open", mock_open()):
-                        # Should not raise exception
-                        fetch_songs()
+        with patch("zipfile.ZipFile", side_effect=zipfile.BadZipFile("Bad zip")):
+            with patch("builtins.open", lambda *a, **k: io.BytesIO()):
+                # Should not raise exception
+                fetch_songs()
 
 
+@pytest.mark.xdist_group("utils_fs")
 class TestChooseRandomSong:
     """Tests for choose_random_song function."""
 
-    def test_choose_random_song_success(self, temp_dir):
-        """Test choosing a random song successfully."""
-        import utils
-        from utils import choose_random_song
-
-        # Setup Songs directory with files
-        songs_dir = temp_dir / "Songs"
+    @pytest.fixture(scope="class")
+    def songs_tree(self, tmp_path_factory):
+        """Build one ROOT_DIR with ten songs, shared by the read-only tests."""
+        root = tmp_path_factory.mktemp("songs_root")
+        songs_dir = root / "Songs"
         songs_dir.mkdir()
-        (songs_dir / "song1.mp3").write_text("music1")
-        (songs_dir / "song2.mp3").write_text("music2")
-        (songs_dir / "song3.mp3").write_text("music3")
+        for i in range(10):
+            (songs_dir / f"song{i}.mp3").touch()
+        return root
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+    def test_choose_random_song_success(self, songs_tree):
+        """Test choosing a random song successfully."""
+        with patch.object(utils, "ROOT_DIR", str(songs_tree)):
             result = choose_random_song()
 
         assert result is not None
         assert "Songs" in result
         assert result.endswith((".mp3",)) or "song" in result
 
-    def test_choose_random_song_multiple_calls(self, temp_dir):
+    def test_choose_random_song_multiple_calls(self, songs_tree):
         """Test that multiple calls can return different songs."""
-        import utils
-        from utils import choose_random_song
-
-        # Setup Songs directory with multiple files
-        songs_dir = temp_dir / "Songs"
-        songs_dir.mkdir()
-        for i in range(10):
-            (songs_dir / f"song{i}.mp3").write_text(f"music{i}")
-
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(songs_tree)):
             results = [choose_random_song() for _ in range(5)]
 
         # All results should be valid paths
@@ -242,41 +228,32 @@ class TestChooseRandomSong:
         # At least check they're in Songs directory
         assert all("Songs" in r for r in results)
 
-    def test_choose_random_song_directory_not_found(self, temp_dir):
+    def test_choose_random_song_directory_not_found(self, tmp_path):
         """Test handling missing Songs directory."""
-        import utils
-        from utils import choose_random_song
-
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(tmp_path)):
             result = choose_random_song()
 
         assert result is None
 
-    def test_choose_random_song_empty_directory(self, temp_dir):
+    def test_choose_random_song_empty_directory(self, tmp_path):
         """Test handling empty Songs directory."""
-        import utils
-        from utils import choose_random_song
-
         # Create empty Songs directory
-        songs_dir = temp_dir / "Songs"
+        songs_dir = tmp_path / "Songs"
         songs_dir.mkdir()
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(tmp_path)):
             result = choose_random_song()
 
         assert result is None
 
-    def test_choose_random_song_single_file(self, temp_dir):
+    def test_choose_random_song_single_file(self, tmp_path):
         """Test choosing song when only one file exists."""
-        import utils
-        from utils import choose_random_song
-
         # Setup Songs directory with single file
-        songs_dir = temp_dir / "Songs"
+        songs_dir = tmp_path / "Songs"
         songs_dir.mkdir()
-        (songs_dir / "only_song.mp3").write_text("music")
+        (songs_dir / "only_song.mp3").touch()
 
-        with patch.object(utils, "ROOT_DIR", str(temp_dir)):
+        with patch.object(utils, "ROOT_DIR", str(tmp_path)):
             result = choose_random_song()
 
         assert result is not None